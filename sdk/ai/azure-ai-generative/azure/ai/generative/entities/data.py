@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
+import sys
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -9,7 +10,8 @@ from azure.ai.ml.entities import Data as DataAsset
 from azure.ai.ml.constants import AssetTypes
 
 
-@dataclass
+# slots drop the per-instance __dict__; dataclass only supports generating them on python 3.10+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Data:
     name: str
     path: str
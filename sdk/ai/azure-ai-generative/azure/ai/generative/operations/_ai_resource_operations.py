@@ -56,7 +56,7 @@ class AIResourceOperations:
         :return: An iterator like instance of AI resource objects
         :rtype: Iterable[AIResource]
         """
-        return [AIResource._from_v2_workspace_hub(wh) for wh in self._ml_client._workspace_hubs.list(scope=scope)]
+        return map(AIResource._from_v2_workspace_hub, self._ml_client._workspace_hubs.list(scope=scope))
 
     @distributed_trace
     @monitor_with_activity(logger, "AIResource.BeginCreate", ActivityType.PUBLICAPI)
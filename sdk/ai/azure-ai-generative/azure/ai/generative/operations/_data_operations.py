@@ -31,16 +31,7 @@ class DataOperations():
 
     def get(self, name: str, version: Optional[str] = None, label: Optional[str] = None) -> Data:
         data = self._ml_client.data.get(name, version, label)
-
-        return Data(
-            name=data.name,
-            version=data.version,
-            type=data.type,
-            path=data.path,
-            description=data.description,
-            tags=data.tags,
-            properties=data.properties
-        )
+        return Data._from_data_asset(data)
 
     def create_or_update(self, data: Data) -> Data:
         try:
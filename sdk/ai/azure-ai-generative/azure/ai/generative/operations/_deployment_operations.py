@@ -4,12 +4,14 @@
 
 import ast
 import datetime
+import functools
+import heapq
 import os
 from pathlib import Path
 import shutil
 import tempfile
 import uuid
-from typing import Any, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import yaml
 
@@ -32,27 +34,45 @@ ops_logger = OpsLogger(__name__)
 logger, module_logger = ops_logger.package_logger, ops_logger.module_logger
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_allowed_skus(inference_compute_allow_list: str) -> Tuple[str, ...]:
+    # the registry stores the allow list as the string repr of a python list
+    return tuple(ast.literal_eval(inference_compute_allow_list))
+
+
 class DeploymentOperations:
     def __init__(self, ml_client: MLClient, connections, **kwargs) -> None:
         self._ml_client = ml_client
         self._connections = connections
-        self._role_definition_client = AuthorizationManagementClient(
+        # workspace name -> workspace ARM id, used as the scope for role assignments
+        self._workspace_scope_cache: Dict[str, str] = {}
+        # (scope, role name) -> role definition id
+        self._role_definition_cache: Dict[Tuple[str, str], str] = {}
+        ops_logger.update_info(kwargs)
+
+    # authorization clients are only needed to grant a local model endpoint access to the workspace,
+    # so their pipelines are built on first use instead of with every DeploymentOperations
+    @functools.cached_property
+    def _role_definition_client(self) -> AuthorizationManagementClient:
+        return AuthorizationManagementClient(
             credential=self._ml_client._credential,
             subscription_id=self._ml_client.subscription_id,
             api_version="2018-01-01-preview",
         )
-        self._role_assignment_client = AuthorizationManagementClient(
+
+    @functools.cached_property
+    def _role_assignment_client(self) -> AuthorizationManagementClient:
+        return AuthorizationManagementClient(
             credential=self._ml_client._credential,
             subscription_id=self._ml_client.subscription_id,
             api_version="2020-10-01-preview",
         )
-        ops_logger.update_info(kwargs)
 
     @distributed_trace
     @monitor_with_activity(logger, "Deployment.CreateOrUpdate", ActivityType.PUBLICAPI)
     def create_or_update(self, deployment: Deployment) -> Any:
         model = deployment.model
-        endpoint_name = deployment.endpoint_name if deployment.endpoint_name else deployment.name
+        endpoint_name = deployment.endpoint_name or deployment.name
 
         data_collector = None
         if deployment.data_collector_enabled:
@@ -89,7 +109,6 @@ class DeploymentOperations:
             identity=endpoint_identity,
         )
         created_endpoint = self._ml_client.begin_create_or_update(v2_endpoint).result()
-        model = deployment.model
         v2_deployment = None
         temp_dir = tempfile.TemporaryDirectory()
         if isinstance(model, PromptflowModel):
@@ -152,7 +171,7 @@ class DeploymentOperations:
                 scoring_script = "score.py"
             else:
                 # validate that path has an mlmodel file and continue
-                if "mlmodel" not in [path.lower() for path in os.listdir(model.path)]:
+                if not any(path.lower() == "mlmodel" for path in os.listdir(model.path)):
                     raise Exception(
                         "An MLModel file must be present in model directory if not"
                         " specifying conda_file and one of loader_module or chat_module for deployment."
@@ -162,17 +181,16 @@ class DeploymentOperations:
             if not endpoint_identity:
                 try:
                     role_name = "AzureML Data Scientist"
-                    scope = self._ml_client.workspaces.get(name=self._ml_client.workspace_name).id
+                    scope = self._get_workspace_scope(self._ml_client.workspace_name)
                     system_principal_id = created_endpoint.identity.principal_id
 
-                    role_defs = self._role_definition_client.role_definitions.list(scope=scope)
-                    role_def = next((r for r in role_defs if r.role_name == role_name))
+                    role_definition_id = self._get_role_definition_id(scope, role_name)
 
                     self._role_assignment_client.role_assignments.create(
                         scope=scope,
                         role_assignment_name=str(uuid.uuid4()),
                         parameters=RoleAssignmentCreateParameters(
-                            role_definition_id=role_def.id, principal_id=system_principal_id
+                            role_definition_id=role_definition_id, principal_id=system_principal_id
                         ),
                     )
                 except ResourceExistsError as e:
@@ -236,43 +254,48 @@ class DeploymentOperations:
                         default_instance_type, deployment, min_sku_spec=min_sku_spec
                     )
                 if "registries/azureml-meta" in model_details.id:
-                    allowed_skus = ast.literal_eval(model_details.tags["inference_compute_allow_list"])
+                    allowed_skus = _parse_allowed_skus(model_details.tags["inference_compute_allow_list"])
                     # check available quota for each sku in the allowed_sku list
                     # pick the sku that has available quota and is the cheapest
                     vm_sizes = self._ml_client.compute._vmsize_operations.list(
                         location=self._ml_client.compute._get_workspace_location()
                     )
                     # create mapping of allowed SKU to (SKU family, number of vCPUs, and cost per hour on linux)
-                    filtered_vm_sizes = [vm_size for vm_size in vm_sizes.value if vm_size.name in allowed_skus]
+                    allowed_skus_set = frozenset(allowed_skus)
+                    filtered_vm_sizes = [vm_size for vm_size in vm_sizes.value if vm_size.name in allowed_skus_set]
                     sku_to_family_vcpu_cost_map = {}
-                    sku_families = []
+                    sku_families = set()
                     for vm_size in filtered_vm_sizes:
-                        cost = None
-                        for vm_price in vm_size.estimated_vm_prices.values:
-                            if vm_price.os_type == "Linux" and vm_price.vm_tier == "Standard":
-                                cost = vm_price.retail_price
+                        cost = next(
+                            (
+                                vm_price.retail_price
+                                for vm_price in vm_size.estimated_vm_prices.values
+                                if vm_price.os_type == "Linux" and vm_price.vm_tier == "Standard"
+                            ),
+                            None,
+                        )
                         sku_to_family_vcpu_cost_map[vm_size.name] = (vm_size.family, vm_size.v_cp_us, cost)
-                        sku_families.append(vm_size.family)
+                        sku_families.add(vm_size.family)
 
-                    # sort allowed skus by price and find the first vm that has enough quota
-                    sku_to_family_vcpu_cost_map = dict(
-                        sorted(sku_to_family_vcpu_cost_map.items(), key=lambda item: item[1][2])
-                    )
+                    # heap of allowed skus by price so only the skus checked for quota below get ordered.
+                    # the insertion index breaks ties the same way a stable sort would.
+                    sku_cost_heap = [
+                        (sku_details[2], index, sku_name)
+                        for index, (sku_name, sku_details) in enumerate(sku_to_family_vcpu_cost_map.items())
+                    ]
+                    heapq.heapify(sku_cost_heap)
                     # get usage info and filter it down to dedicated usage for each SKU family
-                    usage_info = self._ml_client.compute.list_usage()
                     filtered_usage_info = {
-                        filtered_usage.name["value"]: filtered_usage
-                        for filtered_usage in [
-                            usage
-                            for usage in usage_info
-                            if usage.name["value"] in sku_families and "Dedicated" in usage.name["localized_value"]
-                        ]
+                        usage.name["value"]: usage
+                        for usage in self._ml_client.compute.list_usage()
+                        if usage.name["value"] in sku_families and "Dedicated" in usage.name["localized_value"]
                     }
 
-                    # loop over each sku and check if the family has enough cores available that will not
-                    # exceed family limit
-                    for sku_name, sku_details in sku_to_family_vcpu_cost_map.items():
-                        family, vcpus, cost = sku_details
+                    # pop skus from cheapest to most expensive and check if the family has enough cores available
+                    # that will not exceed family limit
+                    while sku_cost_heap:
+                        _, _, sku_name = heapq.heappop(sku_cost_heap)
+                        family, vcpus, cost = sku_to_family_vcpu_cost_map[sku_name]
                         family_usage = filtered_usage_info[family]
                         if deployment.instance_count * vcpus + family_usage.current_value <= family_usage.limit:
                             deployment.instance_type = sku_name
@@ -280,7 +303,7 @@ class DeploymentOperations:
                     if not deployment.instance_type:
                         # if not enough quota, raise an exception and list out SKUs that user needs to request quota for
                         raise Exception(
-                            f"There is no quota in the project's region for these model's allowed inference instance types: {allowed_skus}. "
+                            f"There is no quota in the project's region for these model's allowed inference instance types: {list(allowed_skus)}. "
                             "Please request a quota increase for one of these instance types or try to deploying to a project in a region "
                             "with more quota."
                         )
@@ -350,6 +373,27 @@ class DeploymentOperations:
             deployment_name=name,
         )
 
+    def _get_workspace_scope(self, workspace_name: str) -> str:
+        scope = self._workspace_scope_cache.get(workspace_name)
+        if scope is None:
+            scope = self._ml_client.workspaces.get(name=workspace_name).id
+            self._workspace_scope_cache[workspace_name] = scope
+        return scope
+
+    def _get_role_definition_id(self, scope: str, role_name: str) -> str:
+        key = (scope, role_name)
+        role_definition_id = self._role_definition_cache.get(key)
+        if role_definition_id is None:
+            role_defs = self._role_definition_client.role_definitions.list(
+                scope=scope, filter=f"roleName eq '{role_name}'"
+            )
+            role_def = next((r for r in role_defs if r.role_name == role_name), None)
+            if role_def is None:
+                raise Exception(f"Role definition '{role_name}' was not found at scope {scope}.")
+            role_definition_id = role_def.id
+            self._role_definition_cache[key] = role_definition_id
+        return role_definition_id
+
     def _check_default_instance_type_and_populate(
         self,
         instance_type: str,
@@ -358,7 +402,13 @@ class DeploymentOperations:
         min_sku_spec: str = None,
     ) -> bool:
         vm_sizes = self._ml_client.compute.list_sizes()
-        inference_sku_vm_info = [vm for vm in vm_sizes if vm.name == instance_type][0]
+        inference_sku_vm_info = next((vm for vm in vm_sizes if vm.name == instance_type), None)
+        if inference_sku_vm_info is None:
+            # no point fetching usage for a sku that is not offered in the project's region
+            raise Exception(
+                f"The recommended inference instance type for this model, {instance_type}, "
+                "is not available in the project's region."
+            )
         usage_info = self._ml_client.compute.list_usage()
         # from the list of all usage, get the usage specific to the recommend sku's family
         sku_family_usage = next(
@@ -44,7 +44,7 @@ class AIResourceOperations:
         :return: An iterator like instance of AI resource objects
         :rtype: Iterable[AIResource]
         """
-        return [AIResource._from_v2_workspace_hub(wh) for wh in self._ml_client._workspace_hubs.list(scope=scope)]
+        return map(AIResource._from_v2_workspace_hub, self._ml_client._workspace_hubs.list(scope=scope))
 
     def begin_create(
         self, *, ai_resource: AIResource, update_dependent_resources: bool = False, **kwargs
@@ -3,14 +3,16 @@
 # ---------------------------------------------------------
 
 import ast
+import functools
+import heapq
 import os
+import re
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import mlflow
-import yaml
 
 from azure.ai.ml import MLClient
 from azure.ai.ml.entities import ManagedOnlineDeployment, ManagedOnlineEndpoint, Model
@@ -23,17 +25,38 @@ from .._utils._deployment_utils import get_default_allowed_instance_type_for_hug
 from ..entities.deployment import Deployment
 from ..entities.models import FoundationModel, LocalModel
 
+# the python_function flavor's "data" entry in an MLmodel file; mlflow writes it as an indented plain scalar
+_MLMODEL_DATA_LINE_PATTERN = re.compile(r"^(\s+data:[ \t]*)(.*)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_allowed_skus(inference_compute_allow_list: str) -> Tuple[str, ...]:
+    # the registry stores the allow list as the string repr of a python list
+    return tuple(ast.literal_eval(inference_compute_allow_list))
+
 
 class DeploymentOperations:
     def __init__(self, ml_client: MLClient, connections, **kwargs) -> None:
         self._ml_client = ml_client
         self._connections = connections
-        self._role_definition_client = AuthorizationManagementClient(
+        # workspace name -> workspace ARM id, used as the scope for role assignments
+        self._workspace_scope_cache: Dict[str, str] = {}
+        # (scope, role name) -> role definition id
+        self._role_definition_cache: Dict[Tuple[str, str], str] = {}
+
+    # authorization clients are only needed to grant a local model endpoint access to the workspace,
+    # so their pipelines are built on first use instead of with every DeploymentOperations
+    @functools.cached_property
+    def _role_definition_client(self) -> AuthorizationManagementClient:
+        return AuthorizationManagementClient(
             credential=self._ml_client._credential,
             subscription_id=self._ml_client.subscription_id,
             api_version="2018-01-01-preview",
         )
-        self._role_assignment_client = AuthorizationManagementClient(
+
+    @functools.cached_property
+    def _role_assignment_client(self) -> AuthorizationManagementClient:
+        return AuthorizationManagementClient(
             credential=self._ml_client._credential,
             subscription_id=self._ml_client.subscription_id,
             api_version="2020-10-01-preview",
@@ -41,7 +64,7 @@ class DeploymentOperations:
 
     def create_or_update(self, deployment: Deployment) -> Any:
         model = deployment.model
-        endpoint_name = deployment.endpoint_name if deployment.endpoint_name else deployment.name
+        endpoint_name = deployment.endpoint_name or deployment.name
 
         if deployment.managed_identity:
             from azure.ai.ml.entities import IdentityConfiguration, ManagedIdentityConfiguration
@@ -58,13 +81,18 @@ class DeploymentOperations:
             )
         else:
             endpoint_identity = None
+        if isinstance(model, FoundationModel):
+            # resolve the registry model and instance type before creating the endpoint so that an unknown
+            # model or missing quota fails without leaving an endpoint behind
+            model_id = self._resolve_foundation_model(model, deployment)
+
         v2_endpoint = ManagedOnlineEndpoint(
             name=endpoint_name,
             auth_mode="key",
             identity=endpoint_identity,
         )
-        created_endpoint = self._ml_client.begin_create_or_update(v2_endpoint).result()
-        model = deployment.model
+        # the poller provisions the endpoint in the background, only wait on it once the endpoint itself is needed
+        create_endpoint_poller = self._ml_client.begin_create_or_update(v2_endpoint)
         if isinstance(model, LocalModel):
             if not deployment.instance_type:
                 deployment.instance_type = "Standard_DS3_v2"
@@ -83,38 +111,38 @@ class DeploymentOperations:
                         # we have to hack the MLModel's "data" field since it logs paths according to the underlying OS
                         # i.e. windows will have "\" in the path instead of "/". This causes issues when the deployment has
                         # to read from the path since this path is it not a standard posix path.
-                        with open(f"{mlflow_model_path}/MLModel", "r") as f:
-                            d = yaml.safe_load(f)
-                            d["flavors"]["python_function"]["data"] = d["flavors"]["python_function"]["data"].replace(
-                                "\\", "/"
+                        # only that one line changes, so rewrite it in place rather than round-tripping the yaml.
+                        with open(f"{mlflow_model_path}/MLModel", "r+") as f:
+                            mlmodel = _MLMODEL_DATA_LINE_PATTERN.sub(
+                                lambda match: match.group(1) + match.group(2).replace("\\", "/"), f.read(), count=1
                             )
-
-                        with open(f"{mlflow_model_path}/MLModel", "w+") as f:
-                            yaml.dump(d, f)
+                            f.seek(0)
+                            f.truncate()
+                            f.write(mlmodel)
             else:
                 # validate that path has an mlmodel file and continue
-                if "mlmodel" not in [path.lower() for path in os.listdir(model.path)]:
+                if not any(path.lower() == "mlmodel" for path in os.listdir(model.path)):
                     raise Exception(
                         "An MLModel file must be present in model directory if not"
                         " specifying conda file and loader module for deployment."
                     )
                 mlflow_model_path = model.path
 
+            created_endpoint = create_endpoint_poller.result()
             # attempt to grant endpoint SAI access to workspace:
             if not endpoint_identity:
                 try:
                     role_name = "AzureML Data Scientist"
-                    scope = self._ml_client.workspaces.get(name=self._ml_client.workspace_name).id
+                    scope = self._get_workspace_scope(self._ml_client.workspace_name)
                     system_principal_id = created_endpoint.identity.principal_id
 
-                    role_defs = self._role_definition_client.role_definitions.list(scope=scope)
-                    role_def = next((r for r in role_defs if r.role_name == role_name))
+                    role_definition_id = self._get_role_definition_id(scope, role_name)
 
                     self._role_assignment_client.role_assignments.create(
                         scope=scope,
                         role_assignment_name=str(uuid.uuid4()),
                         parameters=RoleAssignmentCreateParameters(
-                            role_definition_id=role_def.id, principal_id=system_principal_id
+                            role_definition_id=role_definition_id, principal_id=system_principal_id
                         ),
                     )
                 except ResourceExistsError as e:
@@ -165,80 +193,7 @@ class DeploymentOperations:
                 instance_type=deployment.instance_type,
             )
         if isinstance(model, FoundationModel):
-            model_details = get_registry_model(
-                model.registry_name,
-                self._ml_client._credential,
-                model_name=model.name,
-                version=model.version,
-                label="latest" if not model.version else None,
-            )
-            model_id = model_details.id
-
-            if not deployment.instance_type:
-                if model.registry_name == "HuggingFace":
-                    default_instance_type, allowed_instance_types = get_default_allowed_instance_type_for_hugging_face(
-                        model_details, self._ml_client._credential
-                    )
-                    self._check_default_instance_type_and_populate(
-                        default_instance_type, deployment, allowed_instance_types=allowed_instance_types
-                    )
-
-                if model.registry_name == "azureml":
-                    default_instance_type = model_details.properties["inference-recommended-sku"]
-                    min_sku_spec = model_details.properties["inference-min-sku-spec"].split("|")
-                    self._check_default_instance_type_and_populate(
-                        default_instance_type, deployment, min_sku_spec=min_sku_spec
-                    )
-                if model.registry_name == "azureml-meta":
-                    allowed_skus = ast.literal_eval(model_details.tags["inference_compute_allow_list"])
-                    # check available quota for each sku in the allowed_sku list
-                    # pick the sku that has available quota and is the cheapest
-                    vm_sizes = self._ml_client.compute._vmsize_operations.list(
-                        location=self._ml_client.compute._get_workspace_location()
-                    )
-                    # create mapping of allowed SKU to (SKU family, number of vCPUs, and cost per hour on linux)
-                    filtered_vm_sizes = [vm_size for vm_size in vm_sizes.value if vm_size.name in allowed_skus]
-                    sku_to_family_vcpu_cost_map = {}
-                    sku_families = []
-                    for vm_size in filtered_vm_sizes:
-                        cost = None
-                        for vm_price in vm_size.estimated_vm_prices.values:
-                            if vm_price.os_type == "Linux" and vm_price.vm_tier == "Standard":
-                                cost = vm_price.retail_price
-                        sku_to_family_vcpu_cost_map[vm_size.name] = (vm_size.family, vm_size.v_cp_us, cost)
-                        sku_families.append(vm_size.family)
-
-                    # sort allowed skus by price and find the first vm that has enough quota
-                    sku_to_family_vcpu_cost_map = dict(
-                        sorted(sku_to_family_vcpu_cost_map.items(), key=lambda item: item[1][2])
-                    )
-                    # get usage info and filter it down to dedicated usage for each SKU family
-                    usage_info = self._ml_client.compute.list_usage()
-                    filtered_usage_info = {
-                        filtered_usage.name["value"]: filtered_usage
-                        for filtered_usage in [
-                            usage
-                            for usage in usage_info
-                            if usage.name["value"] in sku_families and "Dedicated" in usage.name["localized_value"]
-                        ]
-                    }
-
-                    # loop over each sku and check if the family has enough cores available that will not
-                    # exceed family limit
-                    for sku_name, sku_details in sku_to_family_vcpu_cost_map.items():
-                        family, vcpus, cost = sku_details
-                        family_usage = filtered_usage_info[family]
-                        if deployment.instance_count * vcpus + family_usage.current_value <= family_usage.limit:
-                            deployment.instance_type = sku_name
-                            break
-                    if not deployment.instance_type:
-                        # if not enough quota, raise an exception and list out SKUs that user needs to request quota for
-                        raise Exception(
-                            f"There is no quota in the project's region for these model's allowed inference instance types: {allowed_skus}. "
-                            "Please request a quota increase for one of these instance types or try to deploying to a project in a region "
-                            "with more quota."
-                        )
-
+            created_endpoint = create_endpoint_poller.result()
             v2_deployment = ManagedOnlineDeployment(
                 name=deployment.name,
                 endpoint_name=endpoint_name,
@@ -260,6 +215,90 @@ class DeploymentOperations:
                 endpoint_name=updated_endpoint.name,
                 instance_type=deployment.instance_type,
             )
+        # other model types only create the endpoint, still wait for it so that provisioning errors are raised
+        create_endpoint_poller.result()
+
+    def _resolve_foundation_model(self, model: FoundationModel, deployment: Deployment) -> str:
+        # looks up the registry model and picks an instance type for it if none was provided,
+        # returns the id of the registry model to deploy
+        model_details = get_registry_model(
+            model.registry_name,
+            self._ml_client._credential,
+            model_name=model.name,
+            version=model.version,
+            label="latest" if not model.version else None,
+        )
+        model_id = model_details.id
+
+        if not deployment.instance_type:
+            if model.registry_name == "HuggingFace":
+                default_instance_type, allowed_instance_types = get_default_allowed_instance_type_for_hugging_face(
+                    model_details, self._ml_client._credential
+                )
+                self._check_default_instance_type_and_populate(
+                    default_instance_type, deployment, allowed_instance_types=allowed_instance_types
+                )
+            elif model.registry_name == "azureml":
+                default_instance_type = model_details.properties["inference-recommended-sku"]
+                min_sku_spec = model_details.properties["inference-min-sku-spec"].split("|")
+                self._check_default_instance_type_and_populate(
+                    default_instance_type, deployment, min_sku_spec=min_sku_spec
+                )
+            elif model.registry_name == "azureml-meta":
+                allowed_skus = _parse_allowed_skus(model_details.tags["inference_compute_allow_list"])
+                # check available quota for each sku in the allowed_sku list
+                # pick the sku that has available quota and is the cheapest
+                vm_sizes = self._ml_client.compute._vmsize_operations.list(
+                    location=self._ml_client.compute._get_workspace_location()
+                )
+                # create mapping of allowed SKU to (SKU family, number of vCPUs, and cost per hour on linux)
+                allowed_skus_set = frozenset(allowed_skus)
+                filtered_vm_sizes = [vm_size for vm_size in vm_sizes.value if vm_size.name in allowed_skus_set]
+                sku_to_family_vcpu_cost_map = {}
+                sku_families = set()
+                for vm_size in filtered_vm_sizes:
+                    cost = next(
+                        (
+                            vm_price.retail_price
+                            for vm_price in vm_size.estimated_vm_prices.values
+                            if vm_price.os_type == "Linux" and vm_price.vm_tier == "Standard"
+                        ),
+                        None,
+                    )
+                    sku_to_family_vcpu_cost_map[vm_size.name] = (vm_size.family, vm_size.v_cp_us, cost)
+                    sku_families.add(vm_size.family)
+
+                # heap of allowed skus by price so only the skus checked for quota below get ordered.
+                # the insertion index breaks ties the same way a stable sort would.
+                sku_cost_heap = [
+                    (sku_details[2], index, sku_name)
+                    for index, (sku_name, sku_details) in enumerate(sku_to_family_vcpu_cost_map.items())
+                ]
+                heapq.heapify(sku_cost_heap)
+                # get usage info and filter it down to dedicated usage for each SKU family
+                filtered_usage_info = {
+                    usage.name["value"]: usage
+                    for usage in self._ml_client.compute.list_usage()
+                    if usage.name["value"] in sku_families and "Dedicated" in usage.name["localized_value"]
+                }
+
+                # pop skus from cheapest to most expensive and check if the family has enough cores available
+                # that will not exceed family limit
+                while sku_cost_heap:
+                    _, _, sku_name = heapq.heappop(sku_cost_heap)
+                    family, vcpus, cost = sku_to_family_vcpu_cost_map[sku_name]
+                    family_usage = filtered_usage_info[family]
+                    if deployment.instance_count * vcpus + family_usage.current_value <= family_usage.limit:
+                        deployment.instance_type = sku_name
+                        break
+                if not deployment.instance_type:
+                    # if not enough quota, raise an exception and list out SKUs that user needs to request quota for
+                    raise Exception(
+                        f"There is no quota in the project's region for these model's allowed inference instance types: {list(allowed_skus)}. "
+                        "Please request a quota increase for one of these instance types or try to deploying to a project in a region "
+                        "with more quota."
+                    )
+        return model_id
 
     def get(self, name: str, endpoint_name: str = None) -> Any:
         deployment = self._ml_client.online_deployments.get(
@@ -288,6 +327,27 @@ class DeploymentOperations:
             deployment_name=name,
         )
 
+    def _get_workspace_scope(self, workspace_name: str) -> str:
+        scope = self._workspace_scope_cache.get(workspace_name)
+        if scope is None:
+            scope = self._ml_client.workspaces.get(name=workspace_name).id
+            self._workspace_scope_cache[workspace_name] = scope
+        return scope
+
+    def _get_role_definition_id(self, scope: str, role_name: str) -> str:
+        key = (scope, role_name)
+        role_definition_id = self._role_definition_cache.get(key)
+        if role_definition_id is None:
+            role_defs = self._role_definition_client.role_definitions.list(
+                scope=scope, filter=f"roleName eq '{role_name}'"
+            )
+            role_def = next((r for r in role_defs if r.role_name == role_name), None)
+            if role_def is None:
+                raise Exception(f"Role definition '{role_name}' was not found at scope {scope}.")
+            role_definition_id = role_def.id
+            self._role_definition_cache[key] = role_definition_id
+        return role_definition_id
+
     def _check_default_instance_type_and_populate(
         self,
         instance_type: str,
@@ -296,7 +356,13 @@ class DeploymentOperations:
         min_sku_spec: str = None,
     ) -> bool:
         vm_sizes = self._ml_client.compute.list_sizes()
-        inference_sku_vm_info = [vm for vm in vm_sizes if vm.name == instance_type][0]
+        inference_sku_vm_info = next((vm for vm in vm_sizes if vm.name == instance_type), None)
+        if inference_sku_vm_info is None:
+            # no point fetching usage for a sku that is not offered in the project's region
+            raise Exception(
+                f"The recommended inference instance type for this model, {instance_type}, "
+                "is not available in the project's region."
+            )
         usage_info = self._ml_client.compute.list_usage()
         # from the list of all usage, get the usage specific to the recommend sku's family
         sku_family_usage = next(
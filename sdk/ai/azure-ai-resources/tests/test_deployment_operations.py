@@ -0,0 +1,45 @@
+# ---------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# ---------------------------------------------------------
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("mlflow")
+pytest.importorskip("azure.ai.ml")
+
+from azure.ai.resources.entities.deployment import Deployment
+from azure.ai.resources.entities.models import LocalModel
+from azure.ai.resources.operations._deployment_operations import DeploymentOperations
+
+
+class _StopAfterSaveModel(Exception):
+    pass
+
+
+def test_local_model_code_path_includes_nested_files(tmp_path):
+    # loader modules import helpers from nested directories by their bare module name,
+    # which relies on every nested file being listed in code_path as well
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "helper.py").write_text("")
+    (tmp_path / "score.py").write_text("")
+    (tmp_path / "conda.yaml").write_text("")
+    deployment = Deployment(
+        name="deployment",
+        model=LocalModel(path=str(tmp_path), conda_file="conda.yaml", loader_module="score.py"),
+    )
+    operations = DeploymentOperations(mock.MagicMock(), connections=None)
+
+    with mock.patch("mlflow.pyfunc.save_model", side_effect=_StopAfterSaveModel) as save_model:
+        with pytest.raises(_StopAfterSaveModel):
+            operations.create_or_update(deployment)
+
+    code_path = {Path(path) for path in save_model.call_args.kwargs["code_path"]}
+    assert code_path == {
+        tmp_path / "src",
+        tmp_path / "src" / "helper.py",
+        tmp_path / "score.py",
+        tmp_path / "conda.yaml",
+    }
+    assert save_model.call_args.kwargs["loader_module"] == "score"
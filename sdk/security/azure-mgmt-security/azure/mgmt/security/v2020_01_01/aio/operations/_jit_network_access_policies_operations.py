@@ -6,8 +6,29 @@
 # Code generated by Microsoft (R) AutoRest Code Generator.
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
+import asyncio
+import functools
+import json
 import sys
-from typing import Any, AsyncIterable, Callable, Dict, IO, Optional, TypeVar, Union, overload
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    IO,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 import urllib.parse
 
 from azure.core.async_paging import AsyncItemPaged, AsyncList
@@ -20,8 +41,9 @@ from azure.core.exceptions import (
     map_error,
 )
 from azure.core.pipeline import PipelineResponse
-from azure.core.pipeline.transport import AsyncHttpResponse
+from azure.core.pipeline.transport import AsyncHttpResponse, HttpRequest as _TransportHttpRequest
 from azure.core.rest import HttpRequest
+from azure.core.serialization import AzureJSONEncoder
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.decorator_async import distributed_trace_async
 from azure.core.utils import case_insensitive_dict
@@ -30,10 +52,7 @@ from azure.mgmt.core.exceptions import ARMErrorFormat
 from ... import models as _models
 from ..._vendor import _convert_request
 from ...operations._jit_network_access_policies_operations import (
-    build_create_or_update_request,
-    build_delete_request,
-    build_get_request,
-    build_initiate_request,
+    _is_raw_body,
     build_list_by_region_request,
     build_list_by_resource_group_and_region_request,
     build_list_by_resource_group_request,
@@ -44,9 +63,180 @@ if sys.version_info >= (3, 8):
     from typing import Literal  # pylint: disable=no-name-in-module, ungrouped-imports
 else:
     from typing_extensions import Literal  # type: ignore  # pylint: disable=ungrouped-imports
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 T = TypeVar("T")
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+_ERROR_MAP = MappingProxyType(
+    {
+        401: ClientAuthenticationError,
+        404: ResourceNotFoundError,
+        409: ResourceExistsError,
+        304: ResourceNotModifiedError,
+    }
+)
+_DELETE_SUCCESS_STATUS_CODES = frozenset((200, 204))
+_API_VERSION = "2020-01-01"
+# query string of a request using the default api-version and no other query parameters
+_API_VERSION_QUERY = "?api-version=" + _API_VERSION
+
+
+def _get_error_map(
+    custom_error_map: Optional[Mapping[int, Type[HttpResponseError]]],
+) -> Mapping[int, Type[HttpResponseError]]:
+    # the shared default is read-only, so it only needs copying when the caller overrides entries
+    if not custom_error_map:
+        return _ERROR_MAP
+    return {**_ERROR_MAP, **custom_error_map}
+
+
+def _case_insensitive_dict_or_empty(values: Optional[Mapping[str, Any]]) -> MutableMapping[str, Any]:
+    # callers rarely pass headers or params, so skip building a CaseInsensitiveDict over nothing;
+    # popping a missing key from the plain dict behaves the same
+    if not values:
+        return {}
+    return case_insensitive_dict(values)
+
+
+_MISSING = object()
+
+
+def _pop_either(
+    first: MutableMapping[str, Any], first_key: str, second: MutableMapping[str, Any], second_key: str, default: Any
+) -> Any:
+    value = first.pop(first_key, _MISSING)
+    if value is _MISSING:
+        value = second.pop(second_key, default)
+    return value
+
+
+class _CallOptions(NamedTuple):
+    error_map: Mapping[int, Type[HttpResponseError]]
+    headers: MutableMapping[str, Any]
+    params: MutableMapping[str, Any]
+    api_version: str
+    cls: ClsType[Any]
+    content_type: Optional[str]
+
+
+def _extract_call_options(kwargs: Dict[str, Any], *, with_content_type: bool = False) -> _CallOptions:
+    """Pop the per-call options shared by all operations from ``kwargs``.
+
+    The remaining keyword arguments are passed on to the pipeline. ``content_type`` is only popped
+    by operations with a request body.
+    """
+    error_map = _get_error_map(kwargs.pop("error_map", None))
+    if with_content_type:
+        headers = _case_insensitive_dict_or_empty(kwargs.pop("headers", None))
+    else:
+        # the request builders copy the headers, so they are only copied here to pop Content-Type
+        headers = kwargs.pop("headers", {}) or {}
+    params = _case_insensitive_dict_or_empty(kwargs.pop("params", None))
+
+    # an api-version or Content-Type left behind in params or headers when the keyword wins is overwritten by the
+    # operation, so the fallback is only popped when the keyword is missing
+    api_version: str = _pop_either(kwargs, "api_version", params, "api-version", _API_VERSION)
+    content_type: Optional[str] = None
+    if with_content_type:
+        content_type = _pop_either(kwargs, "content_type", headers, "Content-Type", None)
+    return _CallOptions(error_map, headers, params, api_version, kwargs.pop("cls", None), content_type)
+
+
+# resource group, location and policy names repeat across calls, so their quoted form is cached
+_quote_cached = functools.lru_cache(maxsize=4096)(functools.partial(urllib.parse.quote, safe=""))
+
+
+def _quote_url_argument(value: Any) -> str:
+    # same result as the request builders' Serializer.url/query for "str" values
+    if value is None:
+        raise ValueError("No value for given attribute")
+    return _quote_cached(str(value))
+
+
+def _build_transport_request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    params: MutableMapping[str, Any],
+    api_version: str,
+    *,
+    json_body: Any = None,
+    content: Any = None
+) -> _TransportHttpRequest:
+    """Build the request to send through the pipeline.
+
+    The result matches an ``azure.core.rest.HttpRequest`` converted with ``_convert_request``, so
+    the operations that build their own URL skip the intermediate request. ``url`` must not have a
+    query string yet.
+    """
+    if not params and api_version == _API_VERSION:
+        # the common case needs no query formatting
+        request = _TransportHttpRequest(method, url + _API_VERSION_QUERY, headers=headers)
+    else:
+        params["api-version"] = _quote_url_argument(api_version)
+        request = _TransportHttpRequest(method, url, headers=headers)
+        request.format_parameters(dict(params))
+    if content is None and json_body is not None:
+        request.headers.setdefault("Content-Type", "application/json")
+        content = json_body if hasattr(json_body, "read") else json.dumps(json_body, cls=AzureJSONEncoder)
+    if isinstance(content, (str, bytes)) and content:
+        request.headers.setdefault("Content-Length", str(len(content)))
+    # like the rest request's content, an empty body is sent as no body
+    request.data = content or None
+    return request
+
+
+def _ensure_future_quietly(coro: Awaitable[T]) -> "asyncio.Future[T]":
+    # a prefetched page is abandoned if the caller stops iterating early; retrieve its exception so that
+    # asyncio does not log it as never retrieved
+    future = asyncio.ensure_future(coro)
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return future
+
+
+def _json_content(data: Any) -> Optional[bytes]:
+    # the serializer produces plain JSON types, so orjson can encode them in place of the json module used
+    # by the request; returns None to fall back to it when orjson is not installed
+    if orjson is None or data is None:
+        return None
+    return orjson.dumps(data)
+
+
+class _NextLinkRequestBuilder:
+    """Builds the requests for the next links of one paged operation.
+
+    ARM next links of a paged operation only differ in their query string, so the base URL is
+    split off and formatted from the first next link and reused for the following pages. The requests
+    are built as transport requests directly, as the generated request builders and
+    ``_convert_request`` would only copy the same method and URL.
+    """
+
+    def __init__(self, api_version: str, format_url: Callable[[str], str]) -> None:
+        self._api_version = api_version
+        self._format_url = format_url
+        self._base_url: Optional[str] = None
+        self._request_url = ""
+
+    def __call__(self, next_link: str) -> _TransportHttpRequest:
+        # ARM next links are absolute same-origin URLs, so splitting off the query is enough here
+        base_url, _, query = next_link.partition("#")[0].partition("?")
+        if base_url != self._base_url:
+            self._base_url = base_url
+            self._request_url = self._format_url(base_url)
+        # make call to next link with the client's api-version
+        _query_params: Dict[str, List[str]] = {}
+        for key, value in urllib.parse.parse_qsl(query):
+            _query_params.setdefault(key, []).append(urllib.parse.quote(value))
+        _next_request_params = case_insensitive_dict(_query_params)
+        _next_request_params["api-version"] = self._api_version
+        request = _TransportHttpRequest("GET", self._request_url)
+        request.format_parameters(_next_request_params)
+        return request
+
 
 class JitNetworkAccessPoliciesOperations:
     """
@@ -60,67 +250,77 @@ class JitNetworkAccessPoliciesOperations:
 
     models = _models
 
+    # URL templates of the operations, resolved once here instead of through each method's metadata per call
+    _URL_LIST = "/subscriptions/{subscriptionId}/providers/Microsoft.Security/jitNetworkAccessPolicies"
+    _URL_LIST_BY_REGION = (
+        "/subscriptions/{subscriptionId}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies"
+    )
+    _URL_LIST_BY_RESOURCE_GROUP = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/jitNetworkAccessPolicies"
+    _URL_LIST_BY_RESOURCE_GROUP_AND_REGION = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies"
+    _URL_POLICY = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}"
+    _URL_INITIATE = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}/{jitNetworkAccessPolicyInitiateType}"
+
     def __init__(self, *args, **kwargs) -> None:
         input_args = list(args)
         self._client = input_args.pop(0) if input_args else kwargs.pop("client")
         self._config = input_args.pop(0) if input_args else kwargs.pop("config")
         self._serialize = input_args.pop(0) if input_args else kwargs.pop("serializer")
         self._deserialize = input_args.pop(0) if input_args else kwargs.pop("deserializer")
+        # the client's base url is fixed, so formatting only depends on the relative url of the request
+        self._format_url = functools.lru_cache(maxsize=256)(self._client.format_url)
+        # (template url, subscription id) -> absolute url template with only the per-call path arguments left
+        self._url_templates: Dict[Tuple[str, str], str] = {}
 
-    @distributed_trace
-    def list(self, **kwargs: Any) -> AsyncIterable["_models.JitNetworkAccessPolicy"]:
-        """Policies for protecting resources using Just-in-Time access control.
+    def _finalize_request(self, request: HttpRequest) -> HttpRequest:
+        request = _convert_request(request)
+        request.url = self._format_url(request.url)
+        return request
 
-        :keyword callable cls: A custom type or function that will be passed the direct response
-        :return: An iterator like instance of either JitNetworkAccessPolicy or the result of
-         cls(response)
-        :rtype:
-         ~azure.core.async_paging.AsyncItemPaged[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
-        :raises ~azure.core.exceptions.HttpResponseError:
-        """
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+    def _format_path_url(self, template_url: str, **path_arguments: Any) -> str:
+        """Format an operation's URL template into an absolute URL.
 
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[_models.JitNetworkAccessPoliciesList] = kwargs.pop("cls", None)
+        The client's base URL and subscription are resolved once per template, so each call only
+        quotes and substitutes its own path arguments instead of going through a request builder.
+        """
+        subscription_id = self._config.subscription_id
+        key = (template_url, subscription_id)
+        url_template = self._url_templates.get(key)
+        if url_template is None:
+            prefix, _, rest = template_url.partition("{subscriptionId}")
+            url_template = self._format_url(prefix + _quote_url_argument(subscription_id)) + rest
+            self._url_templates[key] = url_template
+        return url_template.format_map({name: _quote_url_argument(value) for name, value in path_arguments.items()})
+
+    def _paged(
+        self,
+        build_request: Callable[..., HttpRequest],
+        template_url: str,
+        path_arguments: Dict[str, Any],
+        **kwargs: Any
+    ) -> AsyncIterable["_models.JitNetworkAccessPolicy"]:
+        options = _extract_call_options(kwargs)
+        cls: ClsType[_models.JitNetworkAccessPoliciesList] = options.cls
+        prefetch_next_page: bool = kwargs.pop("prefetch_next_page", False)
 
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
+        build_next_link_request = _NextLinkRequestBuilder(self._config.api_version, self._format_url)
+        # next link -> in-flight request for that page, only populated when prefetching
+        _prefetched_pages: Dict[str, "asyncio.Future[PipelineResponse]"] = {}
 
         def prepare_request(next_link=None):
             if not next_link:
 
-                request = build_list_request(
+                request = build_request(
                     subscription_id=self._config.subscription_id,
-                    api_version=api_version,
-                    template_url=self.list.metadata["url"],
-                    headers=_headers,
-                    params=_params,
+                    api_version=options.api_version,
+                    template_url=template_url,
+                    headers=options.headers,
+                    params=options.params,
+                    **path_arguments
                 )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
+                request = self._finalize_request(request)
 
             else:
-                # make call to next link with the client's api-version
-                _parsed_next_link = urllib.parse.urlparse(next_link)
-                _next_request_params = case_insensitive_dict(
-                    {
-                        key: [urllib.parse.quote(v) for v in value]
-                        for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
-                    }
-                )
-                _next_request_params["api-version"] = self._config.api_version
-                request = HttpRequest(
-                    "GET", urllib.parse.urljoin(next_link, _parsed_next_link.path), params=_next_request_params
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-                request.method = "GET"
+                request = build_next_link_request(next_link)
             return request
 
         async def extract_data(pipeline_response):
@@ -128,9 +328,18 @@ class JitNetworkAccessPoliciesOperations:
             list_of_elem = deserialized.value
             if cls:
                 list_of_elem = cls(list_of_elem)  # type: ignore
-            return deserialized.next_link or None, AsyncList(list_of_elem)
+            next_link = deserialized.next_link or None
+            if prefetch_next_page and next_link:
+                # request the next page while the caller is still consuming this one
+                _prefetched_pages[next_link] = _ensure_future_quietly(fetch_page(next_link))
+            return next_link, AsyncList(list_of_elem)
 
         async def get_next(next_link=None):
+            if next_link in _prefetched_pages:
+                return await _prefetched_pages.pop(next_link)
+            return await fetch_page(next_link)
+
+        async def fetch_page(next_link=None):
             request = prepare_request(next_link)
 
             _stream = False
@@ -139,15 +348,30 @@ class JitNetworkAccessPoliciesOperations:
             )
             response = pipeline_response.http_response
 
-            if response.status_code not in [200]:
-                map_error(status_code=response.status_code, response=response, error_map=error_map)
+            if response.status_code != 200:
+                map_error(status_code=response.status_code, response=response, error_map=options.error_map)
                 raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
             return pipeline_response
 
         return AsyncItemPaged(get_next, extract_data)
 
-    list.metadata = {"url": "/subscriptions/{subscriptionId}/providers/Microsoft.Security/jitNetworkAccessPolicies"}
+    @distributed_trace
+    def list(self, **kwargs: Any) -> AsyncIterable["_models.JitNetworkAccessPolicy"]:
+        """Policies for protecting resources using Just-in-Time access control.
+
+        :keyword callable cls: A custom type or function that will be passed the direct response
+        :keyword bool prefetch_next_page: Whether to request the next page while the current page is
+         being iterated. Default value is False.
+        :return: An iterator like instance of either JitNetworkAccessPolicy or the result of
+         cls(response)
+        :rtype:
+         ~azure.core.async_paging.AsyncItemPaged[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return self._paged(build_list_request, self._URL_LIST, {}, **kwargs)
+
+    list.metadata = {"url": _URL_LIST}
 
     @distributed_trace
     def list_by_region(self, asc_location: str, **kwargs: Any) -> AsyncIterable["_models.JitNetworkAccessPolicy"]:
@@ -158,85 +382,19 @@ class JitNetworkAccessPoliciesOperations:
          retrieved from Get locations. Required.
         :type asc_location: str
         :keyword callable cls: A custom type or function that will be passed the direct response
+        :keyword bool prefetch_next_page: Whether to request the next page while the current page is
+         being iterated. Default value is False.
         :return: An iterator like instance of either JitNetworkAccessPolicy or the result of
          cls(response)
         :rtype:
          ~azure.core.async_paging.AsyncItemPaged[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[_models.JitNetworkAccessPoliciesList] = kwargs.pop("cls", None)
-
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        def prepare_request(next_link=None):
-            if not next_link:
-
-                request = build_list_by_region_request(
-                    asc_location=asc_location,
-                    subscription_id=self._config.subscription_id,
-                    api_version=api_version,
-                    template_url=self.list_by_region.metadata["url"],
-                    headers=_headers,
-                    params=_params,
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-
-            else:
-                # make call to next link with the client's api-version
-                _parsed_next_link = urllib.parse.urlparse(next_link)
-                _next_request_params = case_insensitive_dict(
-                    {
-                        key: [urllib.parse.quote(v) for v in value]
-                        for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
-                    }
-                )
-                _next_request_params["api-version"] = self._config.api_version
-                request = HttpRequest(
-                    "GET", urllib.parse.urljoin(next_link, _parsed_next_link.path), params=_next_request_params
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-                request.method = "GET"
-            return request
-
-        async def extract_data(pipeline_response):
-            deserialized = self._deserialize("JitNetworkAccessPoliciesList", pipeline_response)
-            list_of_elem = deserialized.value
-            if cls:
-                list_of_elem = cls(list_of_elem)  # type: ignore
-            return deserialized.next_link or None, AsyncList(list_of_elem)
-
-        async def get_next(next_link=None):
-            request = prepare_request(next_link)
-
-            _stream = False
-            pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
-                request, stream=_stream, **kwargs
-            )
-            response = pipeline_response.http_response
-
-            if response.status_code not in [200]:
-                map_error(status_code=response.status_code, response=response, error_map=error_map)
-                raise HttpResponseError(response=response, error_format=ARMErrorFormat)
-
-            return pipeline_response
-
-        return AsyncItemPaged(get_next, extract_data)
+        return self._paged(
+            build_list_by_region_request, self._URL_LIST_BY_REGION, {"asc_location": asc_location}, **kwargs
+        )
 
-    list_by_region.metadata = {
-        "url": "/subscriptions/{subscriptionId}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies"
-    }
+    list_by_region.metadata = {"url": _URL_LIST_BY_REGION}
 
     @distributed_trace
     def list_by_resource_group(
@@ -249,85 +407,22 @@ class JitNetworkAccessPoliciesOperations:
          name is case insensitive. Required.
         :type resource_group_name: str
         :keyword callable cls: A custom type or function that will be passed the direct response
+        :keyword bool prefetch_next_page: Whether to request the next page while the current page is
+         being iterated. Default value is False.
         :return: An iterator like instance of either JitNetworkAccessPolicy or the result of
          cls(response)
         :rtype:
          ~azure.core.async_paging.AsyncItemPaged[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[_models.JitNetworkAccessPoliciesList] = kwargs.pop("cls", None)
-
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        def prepare_request(next_link=None):
-            if not next_link:
-
-                request = build_list_by_resource_group_request(
-                    resource_group_name=resource_group_name,
-                    subscription_id=self._config.subscription_id,
-                    api_version=api_version,
-                    template_url=self.list_by_resource_group.metadata["url"],
-                    headers=_headers,
-                    params=_params,
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-
-            else:
-                # make call to next link with the client's api-version
-                _parsed_next_link = urllib.parse.urlparse(next_link)
-                _next_request_params = case_insensitive_dict(
-                    {
-                        key: [urllib.parse.quote(v) for v in value]
-                        for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
-                    }
-                )
-                _next_request_params["api-version"] = self._config.api_version
-                request = HttpRequest(
-                    "GET", urllib.parse.urljoin(next_link, _parsed_next_link.path), params=_next_request_params
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-                request.method = "GET"
-            return request
-
-        async def extract_data(pipeline_response):
-            deserialized = self._deserialize("JitNetworkAccessPoliciesList", pipeline_response)
-            list_of_elem = deserialized.value
-            if cls:
-                list_of_elem = cls(list_of_elem)  # type: ignore
-            return deserialized.next_link or None, AsyncList(list_of_elem)
-
-        async def get_next(next_link=None):
-            request = prepare_request(next_link)
-
-            _stream = False
-            pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
-                request, stream=_stream, **kwargs
-            )
-            response = pipeline_response.http_response
-
-            if response.status_code not in [200]:
-                map_error(status_code=response.status_code, response=response, error_map=error_map)
-                raise HttpResponseError(response=response, error_format=ARMErrorFormat)
-
-            return pipeline_response
-
-        return AsyncItemPaged(get_next, extract_data)
+        return self._paged(
+            build_list_by_resource_group_request,
+            self._URL_LIST_BY_RESOURCE_GROUP,
+            {"resource_group_name": resource_group_name},
+            **kwargs
+        )
 
-    list_by_resource_group.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/jitNetworkAccessPolicies"
-    }
+    list_by_resource_group.metadata = {"url": _URL_LIST_BY_RESOURCE_GROUP}
 
     @distributed_trace
     def list_by_resource_group_and_region(
@@ -343,86 +438,22 @@ class JitNetworkAccessPoliciesOperations:
          retrieved from Get locations. Required.
         :type asc_location: str
         :keyword callable cls: A custom type or function that will be passed the direct response
+        :keyword bool prefetch_next_page: Whether to request the next page while the current page is
+         being iterated. Default value is False.
         :return: An iterator like instance of either JitNetworkAccessPolicy or the result of
          cls(response)
         :rtype:
          ~azure.core.async_paging.AsyncItemPaged[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[_models.JitNetworkAccessPoliciesList] = kwargs.pop("cls", None)
-
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        def prepare_request(next_link=None):
-            if not next_link:
-
-                request = build_list_by_resource_group_and_region_request(
-                    resource_group_name=resource_group_name,
-                    asc_location=asc_location,
-                    subscription_id=self._config.subscription_id,
-                    api_version=api_version,
-                    template_url=self.list_by_resource_group_and_region.metadata["url"],
-                    headers=_headers,
-                    params=_params,
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-
-            else:
-                # make call to next link with the client's api-version
-                _parsed_next_link = urllib.parse.urlparse(next_link)
-                _next_request_params = case_insensitive_dict(
-                    {
-                        key: [urllib.parse.quote(v) for v in value]
-                        for key, value in urllib.parse.parse_qs(_parsed_next_link.query).items()
-                    }
-                )
-                _next_request_params["api-version"] = self._config.api_version
-                request = HttpRequest(
-                    "GET", urllib.parse.urljoin(next_link, _parsed_next_link.path), params=_next_request_params
-                )
-                request = _convert_request(request)
-                request.url = self._client.format_url(request.url)
-                request.method = "GET"
-            return request
-
-        async def extract_data(pipeline_response):
-            deserialized = self._deserialize("JitNetworkAccessPoliciesList", pipeline_response)
-            list_of_elem = deserialized.value
-            if cls:
-                list_of_elem = cls(list_of_elem)  # type: ignore
-            return deserialized.next_link or None, AsyncList(list_of_elem)
-
-        async def get_next(next_link=None):
-            request = prepare_request(next_link)
-
-            _stream = False
-            pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
-                request, stream=_stream, **kwargs
-            )
-            response = pipeline_response.http_response
-
-            if response.status_code not in [200]:
-                map_error(status_code=response.status_code, response=response, error_map=error_map)
-                raise HttpResponseError(response=response, error_format=ARMErrorFormat)
-
-            return pipeline_response
-
-        return AsyncItemPaged(get_next, extract_data)
+        return self._paged(
+            build_list_by_resource_group_and_region_request,
+            self._URL_LIST_BY_RESOURCE_GROUP_AND_REGION,
+            {"resource_group_name": resource_group_name, "asc_location": asc_location},
+            **kwargs
+        )
 
-    list_by_resource_group_and_region.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies"
-    }
+    list_by_resource_group_and_region.metadata = {"url": _URL_LIST_BY_RESOURCE_GROUP_AND_REGION}
 
     @distributed_trace_async
     async def get(
@@ -445,32 +476,24 @@ class JitNetworkAccessPoliciesOperations:
         :rtype: ~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[_models.JitNetworkAccessPolicy] = kwargs.pop("cls", None)
-
-        request = build_get_request(
-            resource_group_name=resource_group_name,
-            asc_location=asc_location,
-            jit_network_access_policy_name=jit_network_access_policy_name,
-            subscription_id=self._config.subscription_id,
-            api_version=api_version,
-            template_url=self.get.metadata["url"],
-            headers=_headers,
-            params=_params,
+        options = _extract_call_options(kwargs)
+        cls: ClsType[_models.JitNetworkAccessPolicy] = options.cls
+
+        _headers = _case_insensitive_dict_or_empty(options.headers)
+        _headers["Accept"] = str(_headers.pop("Accept", "application/json"))
+
+        request = _build_transport_request(
+            "GET",
+            self._format_path_url(
+                self._URL_POLICY,
+                resourceGroupName=resource_group_name,
+                ascLocation=asc_location,
+                jitNetworkAccessPolicyName=jit_network_access_policy_name,
+            ),
+            _headers,
+            options.params,
+            options.api_version,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -479,8 +502,8 @@ class JitNetworkAccessPoliciesOperations:
 
         response = pipeline_response.http_response
 
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if response.status_code != 200:
+            map_error(status_code=response.status_code, response=response, error_map=options.error_map)
             raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
         deserialized = self._deserialize("JitNetworkAccessPolicy", pipeline_response)
@@ -490,9 +513,7 @@ class JitNetworkAccessPoliciesOperations:
 
         return deserialized
 
-    get.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}"
-    }
+    get.metadata = {"url": _URL_POLICY}
 
     @overload
     async def create_or_update(
@@ -590,44 +611,37 @@ class JitNetworkAccessPoliciesOperations:
         :rtype: ~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
-        cls: ClsType[_models.JitNetworkAccessPolicy] = kwargs.pop("cls", None)
-
-        content_type = content_type or "application/json"
+        options = _extract_call_options(kwargs, with_content_type=True)
+        cls: ClsType[_models.JitNetworkAccessPolicy] = options.cls
+
+        content_type = options.content_type or "application/json"
         _json = None
         _content = None
-        if isinstance(body, (IO, bytes)):
+        if _is_raw_body(body):
             _content = body
         else:
             _json = self._serialize.body(body, "JitNetworkAccessPolicy")
-
-        request = build_create_or_update_request(
-            resource_group_name=resource_group_name,
-            asc_location=asc_location,
-            jit_network_access_policy_name=jit_network_access_policy_name,
-            subscription_id=self._config.subscription_id,
-            api_version=api_version,
-            content_type=content_type,
-            json=_json,
+            _content = _json_content(_json)
+            if _content is not None:
+                _json = None
+
+        options.headers["Content-Type"] = str(content_type)
+        options.headers["Accept"] = str(options.headers.pop("Accept", "application/json"))
+
+        request = _build_transport_request(
+            "PUT",
+            self._format_path_url(
+                self._URL_POLICY,
+                resourceGroupName=resource_group_name,
+                ascLocation=asc_location,
+                jitNetworkAccessPolicyName=jit_network_access_policy_name,
+            ),
+            options.headers,
+            options.params,
+            options.api_version,
+            json_body=_json,
             content=_content,
-            template_url=self.create_or_update.metadata["url"],
-            headers=_headers,
-            params=_params,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -636,8 +650,8 @@ class JitNetworkAccessPoliciesOperations:
 
         response = pipeline_response.http_response
 
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if response.status_code != 200:
+            map_error(status_code=response.status_code, response=response, error_map=options.error_map)
             raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
         deserialized = self._deserialize("JitNetworkAccessPolicy", pipeline_response)
@@ -647,9 +661,7 @@ class JitNetworkAccessPoliciesOperations:
 
         return deserialized
 
-    create_or_update.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}"
-    }
+    create_or_update.metadata = {"url": _URL_POLICY}
 
     @distributed_trace_async
     async def delete(  # pylint: disable=inconsistent-return-statements
@@ -671,32 +683,24 @@ class JitNetworkAccessPoliciesOperations:
         :rtype: None
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        _headers = kwargs.pop("headers", {}) or {}
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
-
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        cls: ClsType[None] = kwargs.pop("cls", None)
-
-        request = build_delete_request(
-            resource_group_name=resource_group_name,
-            asc_location=asc_location,
-            jit_network_access_policy_name=jit_network_access_policy_name,
-            subscription_id=self._config.subscription_id,
-            api_version=api_version,
-            template_url=self.delete.metadata["url"],
-            headers=_headers,
-            params=_params,
+        options = _extract_call_options(kwargs)
+        cls: ClsType[None] = options.cls
+
+        _headers = _case_insensitive_dict_or_empty(options.headers)
+        _headers["Accept"] = str(_headers.pop("Accept", "application/json"))
+
+        request = _build_transport_request(
+            "DELETE",
+            self._format_path_url(
+                self._URL_POLICY,
+                resourceGroupName=resource_group_name,
+                ascLocation=asc_location,
+                jitNetworkAccessPolicyName=jit_network_access_policy_name,
+            ),
+            _headers,
+            options.params,
+            options.api_version,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -705,16 +709,14 @@ class JitNetworkAccessPoliciesOperations:
 
         response = pipeline_response.http_response
 
-        if response.status_code not in [200, 204]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if response.status_code not in _DELETE_SUCCESS_STATUS_CODES:
+            map_error(status_code=response.status_code, response=response, error_map=options.error_map)
             raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
         if cls:
             return cls(pipeline_response, None, {})
 
-    delete.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}"
-    }
+    delete.metadata = {"url": _URL_POLICY}
 
     @overload
     async def initiate(
@@ -824,48 +826,42 @@ class JitNetworkAccessPoliciesOperations:
         :rtype: ~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessRequest
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        error_map = {
-            401: ClientAuthenticationError,
-            404: ResourceNotFoundError,
-            409: ResourceExistsError,
-            304: ResourceNotModifiedError,
-        }
-        error_map.update(kwargs.pop("error_map", {}) or {})
-
-        _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
-        _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
+        options = _extract_call_options(kwargs, with_content_type=True)
+        cls: ClsType[_models.JitNetworkAccessRequest] = options.cls
 
         jit_network_access_policy_initiate_type: Literal["initiate"] = kwargs.pop(
             "jit_network_access_policy_initiate_type", "initiate"
         )
-        api_version: str = kwargs.pop("api_version", _params.pop("api-version", "2020-01-01"))
-        content_type: Optional[str] = kwargs.pop("content_type", _headers.pop("Content-Type", None))
-        cls: ClsType[_models.JitNetworkAccessRequest] = kwargs.pop("cls", None)
 
-        content_type = content_type or "application/json"
+        content_type = options.content_type or "application/json"
         _json = None
         _content = None
-        if isinstance(body, (IO, bytes)):
+        if _is_raw_body(body):
             _content = body
         else:
             _json = self._serialize.body(body, "JitNetworkAccessPolicyInitiateRequest")
-
-        request = build_initiate_request(
-            resource_group_name=resource_group_name,
-            asc_location=asc_location,
-            jit_network_access_policy_name=jit_network_access_policy_name,
-            subscription_id=self._config.subscription_id,
-            jit_network_access_policy_initiate_type=jit_network_access_policy_initiate_type,
-            api_version=api_version,
-            content_type=content_type,
-            json=_json,
+            _content = _json_content(_json)
+            if _content is not None:
+                _json = None
+
+        options.headers["Content-Type"] = str(content_type)
+        options.headers["Accept"] = str(options.headers.pop("Accept", "application/json"))
+
+        request = _build_transport_request(
+            "POST",
+            self._format_path_url(
+                self._URL_INITIATE,
+                resourceGroupName=resource_group_name,
+                ascLocation=asc_location,
+                jitNetworkAccessPolicyName=jit_network_access_policy_name,
+                jitNetworkAccessPolicyInitiateType=jit_network_access_policy_initiate_type,
+            ),
+            options.headers,
+            options.params,
+            options.api_version,
+            json_body=_json,
             content=_content,
-            template_url=self.initiate.metadata["url"],
-            headers=_headers,
-            params=_params,
         )
-        request = _convert_request(request)
-        request.url = self._client.format_url(request.url)
 
         _stream = False
         pipeline_response: PipelineResponse = await self._client._pipeline.run(  # pylint: disable=protected-access
@@ -874,8 +870,8 @@ class JitNetworkAccessPoliciesOperations:
 
         response = pipeline_response.http_response
 
-        if response.status_code not in [202]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if response.status_code != 202:
+            map_error(status_code=response.status_code, response=response, error_map=options.error_map)
             raise HttpResponseError(response=response, error_format=ARMErrorFormat)
 
         deserialized = self._deserialize("JitNetworkAccessRequest", pipeline_response)
@@ -885,6 +881,4 @@ class JitNetworkAccessPoliciesOperations:
 
         return deserialized
 
-    initiate.metadata = {
-        "url": "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Security/locations/{ascLocation}/jitNetworkAccessPolicies/{jitNetworkAccessPolicyName}/{jitNetworkAccessPolicyInitiateType}"
-    }
+    initiate.metadata = {"url": _URL_INITIATE}
@@ -6,9 +6,122 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import IO, Any, Awaitable, Iterable, List, Tuple, TypeVar, Union
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from ._jit_network_access_policies_operations import (
+    JitNetworkAccessPoliciesOperations as _JitNetworkAccessPoliciesOperations,
+)
+from ... import models as _models
+
+T = TypeVar("T")
+
+
+async def _gather_bounded(
+    coros: Iterable[Awaitable[T]], max_concurrency: int, return_exceptions: bool = False
+) -> List[T]:
+    if max_concurrency < 1:
+        raise ValueError("Parameter 'max_concurrency' must be at least 1, got {}.".format(max_concurrency))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run_one(coro) for coro in coros), return_exceptions=return_exceptions)
+
+
+class JitNetworkAccessPoliciesOperations(_JitNetworkAccessPoliciesOperations):
+    """JitNetworkAccessPoliciesOperations with bulk variants of get, delete and initiate.
+
+    Each request of a batch holds its own connection, so a max_concurrency above the limit of the
+    transport's aiohttp connector (100 connections by default) only queues the excess requests.
+    """
+
+    async def get_many(
+        self, policies: Iterable[Tuple[str, str, str]], *, max_concurrency: int = 32, **kwargs: Any
+    ) -> List[_models.JitNetworkAccessPolicy]:
+        """Get several Just-in-Time access control policies concurrently.
+
+        :param policies: The policies to get, each given as a tuple of resource group name, ASC
+         location and Just-in-Time access configuration policy name. Required.
+        :type policies: iterable[tuple[str, str, str]]
+        :keyword max_concurrency: Maximum number of requests in flight at once. Default value is 32.
+        :paramtype max_concurrency: int
+        :keyword callable cls: A custom type or function that will be passed the direct response of
+         each request
+        :return: The JitNetworkAccessPolicy, or the result of cls(response), of each requested policy,
+         in the same order as ``policies``
+        :rtype: list[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicy]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        return await _gather_bounded((self.get(*policy, **kwargs) for policy in policies), max_concurrency)
+
+    async def delete_many(
+        self,
+        policies: Iterable[Tuple[str, str, str]],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs: Any
+    ) -> List[Any]:
+        """Delete several Just-in-Time access control policies concurrently.
+
+        :param policies: The policies to delete, each given as a tuple of resource group name, ASC
+         location and Just-in-Time access configuration policy name. Required.
+        :type policies: iterable[tuple[str, str, str]]
+        :keyword max_concurrency: Maximum number of requests in flight at once. Default value is 32.
+        :paramtype max_concurrency: int
+        :keyword return_exceptions: Whether the error of a failed deletion is returned in its place
+         instead of raised. Default value is False.
+        :paramtype return_exceptions: bool
+        :keyword callable cls: A custom type or function that will be passed the direct response of
+         each request
+        :return: None, the result of cls(response) or, with return_exceptions, the error of each
+         requested policy, in the same order as ``policies``
+        :rtype: list
+        :raises ~azure.core.exceptions.HttpResponseError:
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        return await _gather_bounded(
+            (self.delete(*policy, **kwargs) for policy in policies), max_concurrency, return_exceptions
+        )
+
+    async def initiate_many(
+        self,
+        requests: Iterable[Tuple[str, str, str, Union[_models.JitNetworkAccessPolicyInitiateRequest, IO]]],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+        **kwargs: Any
+    ) -> List[Any]:
+        """Initiate several Just-in-Time access requests concurrently.
+
+        :param requests: The requests to initiate, each given as a tuple of resource group name, ASC
+         location, Just-in-Time access configuration policy name and request body. Required.
+        :type requests: iterable[tuple[str, str, str,
+         ~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessPolicyInitiateRequest or IO]]
+        :keyword max_concurrency: Maximum number of requests in flight at once. Default value is 32.
+        :paramtype max_concurrency: int
+        :keyword return_exceptions: Whether the error of a failed request is returned in its place
+         instead of raised. Default value is False.
+        :paramtype return_exceptions: bool
+        :keyword callable cls: A custom type or function that will be passed the direct response of
+         each request
+        :return: The JitNetworkAccessRequest, the result of cls(response) or, with return_exceptions,
+         the error of each request, in the same order as ``requests``
+        :rtype: list[~azure.mgmt.security.v2020_01_01.models.JitNetworkAccessRequest]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        return await _gather_bounded(
+            (self.initiate(*request, **kwargs) for request in requests), max_concurrency, return_exceptions
+        )
+
+
+# Add all objects you want publicly available to users at this package level
+__all__: List[str] = ["JitNetworkAccessPoliciesOperations"]
 
 
 def patch_sdk():
@@ -41,6 +41,12 @@ _SERIALIZER = Serializer()
 _SERIALIZER.client_side_validation = False
 
 
+def _is_raw_body(body: Any) -> bool:
+    # bytes-like and file-like bodies are sent as-is; checking for read() avoids typing.IO, which real
+    # file objects are not instances of
+    return isinstance(body, (bytes, bytearray, memoryview)) or hasattr(body, "read")
+
+
 def build_list_request(subscription_id: str, **kwargs: Any) -> HttpRequest:
     _headers = case_insensitive_dict(kwargs.pop("headers", {}) or {})
     _params = case_insensitive_dict(kwargs.pop("params", {}) or {})
@@ -906,7 +912,7 @@ class JitNetworkAccessPoliciesOperations:
         content_type = content_type or "application/json"
         _json = None
         _content = None
-        if isinstance(body, (IO, bytes)):
+        if _is_raw_body(body):
             _content = body
         else:
             _json = self._serialize.body(body, "JitNetworkAccessPolicy")
@@ -1143,7 +1149,7 @@ class JitNetworkAccessPoliciesOperations:
         content_type = content_type or "application/json"
         _json = None
         _content = None
-        if isinstance(body, (IO, bytes)):
+        if _is_raw_body(body):
             _content = body
         else:
             _json = self._serialize.body(body, "JitNetworkAccessPolicyInitiateRequest")
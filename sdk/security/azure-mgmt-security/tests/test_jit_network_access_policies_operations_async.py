@@ -0,0 +1,162 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from azure.core.credentials import AccessToken
+from azure.core.pipeline.transport import AsyncHttpResponse, AsyncHttpTransport
+from azure.mgmt.security.v2020_01_01 import models
+from azure.mgmt.security.v2020_01_01.aio import SecurityCenter
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+
+class FakeCredential:
+    async def get_token(self, *scopes, **kwargs):
+        return AccessToken("fake_token", 9999999999)
+
+    async def close(self):
+        pass
+
+
+class FakeResponse(AsyncHttpResponse):
+    def __init__(self, request, status_code, body):
+        super(FakeResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = {"content-type": "application/json"}
+        self.content_type = "application/json"
+        self.reason = "OK"
+        self._body = json.dumps(body).encode("utf-8") if body is not None else b""
+
+    def body(self):
+        return self._body
+
+
+class FakeTransport(AsyncHttpTransport):
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # let the other requests of the batch start before this one completes
+            await asyncio.sleep(0)
+            if request.method == "DELETE":
+                return FakeResponse(request, 204, None)
+            if request.method == "POST":
+                return FakeResponse(
+                    request,
+                    202,
+                    {"virtualMachines": [], "startTimeUtc": "2020-01-01T00:00:00Z", "requestor": request.url},
+                )
+            name = request.url.split("?")[0].rsplit("/", 1)[-1]
+            return FakeResponse(request, 200, {"id": "/" + name, "name": name})
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def transport():
+    return FakeTransport()
+
+
+@pytest.fixture
+def client(transport):
+    return SecurityCenter(FakeCredential(), SUBSCRIPTION_ID, transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_get_many_keeps_order(client):
+    policies = [("rg1", "westus", "p1"), ("rg2", "eastus", "p2"), ("rg1", "westus", "p3")]
+    result = await client.jit_network_access_policies.get_many(policies)
+    assert [policy.name for policy in result] == ["p1", "p2", "p3"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_bounds_concurrency(client, transport):
+    policies = [("rg1", "westus", "p{}".format(i)) for i in range(10)]
+    result = await client.jit_network_access_policies.get_many(policies, max_concurrency=3)
+    assert len(result) == 10
+    assert len(transport.requests) == 10
+    assert transport.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_get_many_rejects_max_concurrency_below_one(client, transport, max_concurrency):
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(
+            client.jit_network_access_policies.get_many([("rg1", "westus", "p1")], max_concurrency=max_concurrency),
+            timeout=5,
+        )
+    assert transport.requests == []
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_patched_get(client, transport):
+    calls = []
+
+    async def fake_get(*args, **kwargs):
+        calls.append((args, kwargs))
+        return "patched"
+
+    operations = client.jit_network_access_policies
+    with mock.patch.object(operations, "get", fake_get):
+        result = await operations.get_many([("rg1", "westus", "p1")], cls=None)
+    assert result == ["patched"]
+    assert calls == [(("rg1", "westus", "p1"), {"cls": None})]
+    assert transport.requests == []
+
+
+@pytest.mark.asyncio
+async def test_delete_many(client, transport):
+    policies = [("rg1", "westus", "p1"), ("rg1", "westus", "p2")]
+    result = await client.jit_network_access_policies.delete_many(policies, max_concurrency=1)
+    assert result == [None, None]
+    assert [request.method for request in transport.requests] == ["DELETE", "DELETE"]
+    assert transport.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_initiate_many_keeps_order(client, transport):
+    body = models.JitNetworkAccessPolicyInitiateRequest(virtual_machines=[])
+    requests = [("rg1", "westus", "p1", body), ("rg2", "eastus", "p2", body)]
+    result = await client.jit_network_access_policies.initiate_many(requests)
+    assert [response.requestor for response in result] == [request.url for request in transport.requests]
+    assert "/p1/initiate" in result[0].requestor
+    assert "/p2/initiate" in result[1].requestor
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_reject_max_concurrency_below_one(client, transport):
+    operations = client.jit_network_access_policies
+    body = models.JitNetworkAccessPolicyInitiateRequest(virtual_machines=[])
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(operations.delete_many([("rg1", "westus", "p1")], max_concurrency=0), timeout=5)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(operations.initiate_many([("rg1", "westus", "p1", body)], max_concurrency=0), timeout=5)
+    assert transport.requests == []